@@ -1,14 +1,57 @@
-from datetime import time
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import os.path
 from pathlib import Path
+import queue
+import sys
+import time
 import tkinter as tk
-from tkinter import ttk, filedialog
+from tkinter import ttk, filedialog, messagebox
 
 import customtkinter as ctk
+from mutagen import MutagenError
 from mutagen.mp3 import MP3
 import pygame
 import PIL.Image
 
+ASSETS_DIR = Path(__file__).parent / 'assets'
 
+
+def _load_icon(file_name: str) -> PIL.Image.Image:
+    """
+    Reads and decodes an image from our assets folder, closing the file right after.
+
+    Args:
+        file_name (str): The name of the image file inside the assets folder.
+
+    Returns:
+        PIL.Image.Image: The fully decoded image.
+    """
+    with PIL.Image.open(ASSETS_DIR / file_name) as image:
+        image.load()
+    return image
+
+
+def _load_icons() -> dict[str, PIL.Image.Image]:
+    """
+    Decodes all of our button icons.
+
+    Returns:
+        dict[str, PIL.Image.Image]: The decoded icons, keyed by the button they belong to.
+    """
+    return {name: _load_icon(file_name)
+            for name, file_name in [('back', 'left-arrows.png'),
+                                    ('forward', 'next.png'),
+                                    ('play', 'play-button.png'),
+                                    ('pause', 'pause.png'),
+                                    ('stop', 'stop-button.png')]}
+
+
+# The button icons, decoded once on a background thread while the mixer and the window start up.
+_icons_future = ThreadPoolExecutor(max_workers=1, thread_name_prefix='icon-loader').submit(_load_icons)
+
+
+@functools.lru_cache(maxsize=4096)  # covers every second of songs up to ~68 minutes
 def _format_seconds(total_seconds: int) -> str:
     """
     Converts a total number of seconds into a formatted string representing minutes and seconds.
@@ -24,8 +67,20 @@ def _format_seconds(total_seconds: int) -> str:
         '02:05'
     """
     minute, second = divmod(total_seconds, 60)
-    total = time(minute=minute, second=second).strftime('%M:%S')
-    return total
+    return f'{minute:02d}:{second:02d}'
+
+
+def _read_song_info(song: str) -> tuple[str, int]:
+    """
+    Reads the path and length of a song from the file system.
+
+    Args:
+        song (str): The path to the mp3 file.
+
+    Returns:
+        tuple[str, int]: The song's path and its length in whole seconds.
+    """
+    return song, int(MP3(song).info.length)
 
 
 def volume_func(volume_value: float) -> None:
@@ -48,8 +103,23 @@ def volume_func(volume_value: float) -> None:
 ctk.set_appearance_mode('light')
 ctk.set_default_color_theme('dark-blue')
 
-# Initialize Pygame
-pygame.mixer.init()
+# Mixer buffer size in samples. Smaller buffers mean less delay between a click and the
+# audible response; Linux (ALSA) tends to underrun below 1024, so it starts a step higher.
+MIXER_BUFFER = 512 if sys.platform == 'win32' else 1024
+
+# Initialize Pygame, falling back to bigger buffers if the audio driver rejects the small one.
+for _buffer in sorted({MIXER_BUFFER, 1024, 2048}):
+    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=_buffer)
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        if _buffer == 2048:  # no bigger buffer left to try
+            raise
+    else:
+        MIXER_BUFFER = _buffer
+        break
+
+SONG_END_EVENT = pygame.USEREVENT + 1  # The event pygame posts when the music stops.
 
 
 class App(ctk.CTk):
@@ -59,7 +129,13 @@ class App(ctk.CTk):
         super().__init__()
         self.geometry('550x450')
         self.title('MP3 Player')
-        self.song_dictionary = dict()  # A dictionary of 'song title: song path'.
+        self.song_dictionary = dict()  # A dictionary of 'song title: (song path, song length in seconds)'.
+        # Pygame's event queue (which tells us when a song ends) only works once the display module is up.
+        # It has to start after Tk's root window exists: on macOS both register themselves as the
+        # application object, and Tk crashes if SDL got there first.
+        pygame.display.init()
+        pygame.mixer.music.set_endevent(SONG_END_EVENT)  # ask pygame to tell us when a song finishes
+        self._seek_id = None  # The ID of the pending seek scheduled by the progress bar.
 
         # Main frame (The one that holds all the pieces).
         self.main_frame = ctk.CTkFrame(self, fg_color='transparent', width=500, height=400)
@@ -96,21 +172,27 @@ class App(ctk.CTk):
 
         # A class that creates the Menu bar at the top.
         self.menus = Menus(self, self.get_playlist_widget(), self.get_song_dictionary())
-        # Bind the mouse wheel events to the increase and decrease functions
-        self.bind('<MouseWheel>',
-                  lambda event: self.increase_volume(event) if event.delta > 0 else self.decrease_volume(event))
-
-    def increase_volume(self, event):
-        # Increase the volume by moving the slider up
-        current_value = self.top_frame.volume_slider.get()
-        if current_value < 1.0:  # Assuming the maximum value is 100
-            self.top_frame.volume_slider.set(current_value + 0.05)
-
-    def decrease_volume(self, event):
-        # Decrease the volume by moving the slider down
-        current_value = self.top_frame.volume_slider.get()
-        if current_value > 0:  # Assuming the minimum value is 0
-            self.top_frame.volume_slider.set(current_value - 0.05)
+        # Bind the mouse wheel events to the volume slider
+        self._wheel_accum = 0  # The volume change scrolled since the last update.
+        self._wheel_flush_id = None
+        self.bind('<MouseWheel>', self._on_wheel)
+
+    def _on_wheel(self, event):
+        """Collects the scrolled volume change, applying it at most once every 16 milliseconds."""
+        # each notch of the wheel moves the volume by 5%, only the sign of delta is used since its
+        # size differs between platforms (multiples of 120 on Windows, around 1 on macOS)
+        self._wheel_accum += 0.05 if event.delta > 0 else -0.05
+        if not self._wheel_flush_id:
+            self._wheel_flush_id = self.after(16, self._flush_wheel)
+
+    def _flush_wheel(self):
+        """Moves the volume slider by the collected change and updates the audio level."""
+        # keeping the new value between 0 (silent) and 1 (loudest)
+        new_value = min(max(self.top_frame.volume_slider.get() + self._wheel_accum, 0.0), 1.0)
+        self.top_frame.volume_slider.set(new_value)
+        volume_func(new_value)
+        self._wheel_accum = 0
+        self._wheel_flush_id = None
 
     def get_song_dictionary(self):
         """Returns the song dictionary"""
@@ -121,9 +203,23 @@ class App(ctk.CTk):
         return self.top_frame.get_playlist_widget()
 
     def set_progress(self, pos: float) -> None:
-        """Sets the play position based on changes on slider."""
+        """
+        Sets the play position based on changes on slider. Dragging the slider fires this for every
+        step, so the actual seek waits until the slider has been still for 120 milliseconds.
+        """
+        if self._seek_id:  # a newer position came in, so drop the pending seek
+            self.after_cancel(self._seek_id)
+        self._seek_id = self.after(120, self._commit_seek, pos)
+
+    def _commit_seek(self, pos: float) -> None:
+        """Plays the song from the position chosen on the slider."""
+        self._seek_id = None
+        current_position = pygame.mixer.music.get_pos() / 1000 + self.my_buttons.seek_position
+        if abs(pos - current_position) < 1:  # already there, restarting the playback is not needed
+            return
         pygame.mixer.music.play(start=pos)  # plays the song from new position
-        self.my_buttons.seek_position = pos  # saves the seek position inside our buttons class
+        # saves the seek position in whole seconds inside our buttons class
+        self.my_buttons.seek_position = int(pos)
 
 
 class Menus(tk.Menu):
@@ -133,6 +229,20 @@ class Menus(tk.Menu):
         super().__init__(parent)
         self.play_list_widget = playlist_widget  # A reference to our playlist widget.
         self.songs_dictionary = songs_dictionary  # A reference to our song's dictionary.
+        self._known_paths: set[str] = set()  # The paths in our dictionary, for quick duplicate checks.
+        # Worker threads that parse the mp3 files, so big imports don't freeze the window.
+        # Parsing mostly waits on the disk, so we let the executor size itself for I/O bound
+        # work, keeping more reads in flight at once.
+        self._pool = ThreadPoolExecutor(thread_name_prefix='song-importer')
+        # Worker threads never touch Tk, they put '(order, song, song info or None)' here for the UI thread.
+        self._parsed_queue = queue.SimpleQueue()
+        self._parsed = {}  # Songs taken off the queue that wait for the ones picked before them.
+        self._submitted = 0  # How many songs were handed to the workers so far.
+        self._next_order = 0  # The order number of the next song to add to the playlist.
+        self._collect_id = None
+        self._unreadable_songs = []  # Picked files that couldn't be parsed, reported once the import is done.
+        self._pending_names = []  # Imported titles waiting to be shown in the playlist widget.
+        self._flush_id = None
 
         # Adding the menu bar to our main window.
         parent.configure(menu=self)
@@ -162,27 +272,116 @@ class Menus(tk.Menu):
         song = filedialog.askopenfilename(title='Add song',
                                           filetypes=(('mp3 files', '*.mp3'), ('All files', '*.*'))
                                           )
-        self._song_importer(song)  # passes the selected song to the importer function.
+        if song:  # an empty string means the dialog was cancelled
+            self._song_importer(song)  # passes the selected song to the importer function.
 
     def add_multiple_songs(self):
         """Prompts user to select a various number of songs"""
         songs = filedialog.askopenfilenames(title='Add songs',
                                             filetypes=(('mp3 files', '*.mp3'), ('All files', '*.*')))
 
-        # Iterates the tuple of songs and passes each to our importer function.
+        # Parses each song on a worker thread, numbering them so they can be added in the order they were picked.
         for song in songs:
-            self._song_importer(song)
+            self._pool.submit(self._parse_song, self._submitted, song)
+            self._submitted += 1
+        if songs and not self._collect_id:
+            self._collect_id = self.after(50, self._collect_imports)
+
+    def _parse_song(self, order: int, song: str) -> None:
+        """Reads a song's info and puts it on the parsed queue. Runs on a worker thread."""
+        try:
+            song_info = _read_song_info(song)
+        except Exception:  # not an mp3 file, or a damaged one; the song must still be put on the queue
+            song_info = None
+        self._parsed_queue.put((order, song, song_info))
+
+    def _collect_imports(self) -> None:
+        """
+        Adds the parsed songs to our playlist in the order they were picked. Runs on the UI thread
+        every 50 milliseconds while an import is in progress.
+        """
+        while True:
+            try:
+                order, song, song_info = self._parsed_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._parsed[order] = (song, song_info)
+
+        # a song that finished early waits here until the ones picked before it are done too
+        while self._next_order in self._parsed:
+            song, song_info = self._parsed.pop(self._next_order)
+            self._next_order += 1
+            if song_info is None:
+                self._unreadable_songs.append(song)
+            else:
+                self._queue_import(*song_info)
+
+        if self._next_order < self._submitted:  # still waiting on some songs
+            self._collect_id = self.after(50, self._collect_imports)
+            return
+        self._collect_id = None
+
+        if self._unreadable_songs:
+            # taking the list first: the dialog runs a nested event loop that may call us again
+            songs, self._unreadable_songs = self._unreadable_songs, []
+            self._report_unreadable(songs)
+
+    @staticmethod
+    def _report_unreadable(songs: list[str]) -> None:
+        """Tells the user which of the picked files couldn't be added to the playlist."""
+        messagebox.showwarning(title='Add songs',
+                               message='These files could not be read as mp3 songs and were skipped:\n'
+                                       + '\n'.join(songs))
 
     def _song_importer(self, song: str) -> None:
-        """A helper function that adds songs to our playlist and updates the dictionary."""
-        song_path = Path(song)
-        song_name = song_path.stem  # gets the song's title.
-
-        # checks our dictionary to avoid adding duplicates
-        if song_path not in self.songs_dictionary.values():
-            self.songs_dictionary[song_name] = song_path  # adds to our dictionary
+        """A helper function that reads a song's info and adds it to our playlist."""
+        try:
+            song_info = _read_song_info(song)
+        except MutagenError:  # not an mp3 file, or a damaged one
+            self._report_unreadable([song])
+            return
+        song_name = self._add_to_dictionary(*song_info)
+        if song_name:
             self.play_list_widget.insert('end', song_name)  # adds to our playlist widget
-            # Serves for display purposes.
+
+    def _queue_import(self, song_path: str, song_length: int) -> None:
+        """
+        Adds a song parsed by a worker thread to the dictionary and queues its title for the playlist.
+        Titles that arrive close together are inserted into the widget with a single call once Tk is idle.
+        """
+        song_name = self._add_to_dictionary(song_path, song_length)
+        if song_name:
+            self._pending_names.append(song_name)
+            if not self._flush_id:
+                self._flush_id = self.after_idle(self._flush_pending_names)
+
+    def _flush_pending_names(self) -> None:
+        """Inserts all the queued titles into our playlist widget at once."""
+        self.play_list_widget.insert('end', *self._pending_names)
+        self._pending_names.clear()
+        self._flush_id = None
+
+    def _add_to_dictionary(self, song_path: str, song_length: int) -> str | None:
+        """Adds an already parsed song to our dictionary and returns its title, or None if it's a duplicate."""
+        # gets the song's title (plain string slicing, pygame and mutagen take the path as a string anyway)
+        song_name = os.path.splitext(os.path.basename(song_path))[0]
+
+        # checks our known paths to avoid adding duplicates
+        if song_path in self._known_paths:
+            return None
+        if song_name in self.songs_dictionary:  # a different file with the same title gets replaced
+            self._known_paths.discard(self.songs_dictionary[song_name][0])
+        self._known_paths.add(song_path)
+        # storing the song's length too, so playing it later is only a dictionary lookup
+        self.songs_dictionary[song_name] = (song_path, song_length)  # adds to our dictionary
+        return song_name
+
+    def destroy(self):
+        """Stops the import workers when the window closes, so the app doesn't wait for queued songs."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self._collect_id:
+            self.after_cancel(self._collect_id)
+        super().destroy()
 
     def delete_one_song(self):
         """Removes the selected song from both of our playlist and our dictionary."""
@@ -191,12 +390,14 @@ class Menus(tk.Menu):
 
         # Doing the deletions
         self.play_list_widget.delete(selected_index)
-        self.songs_dictionary.pop(selected_name)
+        selected_path, _ = self.songs_dictionary.pop(selected_name)
+        self._known_paths.discard(selected_path)
 
     def delete_all_songs(self):
         """Clears our playlist and dictionary."""
         self.play_list_widget.delete(0, 'end')
         self.songs_dictionary.clear()
+        self._known_paths.clear()
 
 
 class TopFrame(ctk.CTkFrame):
@@ -206,6 +407,7 @@ class TopFrame(ctk.CTkFrame):
         super().__init__(parent, **kwargs)
 
         # creating our playlist widget
+        # (a Listbox only draws the rows that are visible, so it stays fast even with huge playlists)
         self.song_list = tk.Listbox(self,
                                     bg='black',
                                     fg='green',
@@ -220,9 +422,11 @@ class TopFrame(ctk.CTkFrame):
         self.volume_frame.pack(side='left')
 
         # volume slider
+        self._last_volume_time = 0.0  # When the audio level was last changed (time.perf_counter).
+        self._volume_flush_id = None
         self.volume_slider = ctk.CTkSlider(self.volume_frame,
                                            orientation='vertical',
-                                           command=lambda e: volume_func(e)  # calls the function to change audio level
+                                           command=self._throttled_volume  # changes the audio level
                                            )
         self.volume_slider.set(0.3)  # setting the starting volume
         self.volume_slider.pack()
@@ -231,6 +435,26 @@ class TopFrame(ctk.CTkFrame):
         """Returns the reference to playlist widget"""
         return self.song_list
 
+    def _throttled_volume(self, volume_value: float) -> None:
+        """
+        Passes the slider's value to `volume_func` at most once every 33 milliseconds while dragging.
+        Values that come in too soon are held back, and the last one is always applied.
+        """
+        if self._volume_flush_id:  # a newer value replaces the held back one
+            self.after_cancel(self._volume_flush_id)
+            self._volume_flush_id = None
+
+        if time.perf_counter() - self._last_volume_time >= 0.033:
+            self._apply_volume(volume_value)
+        else:
+            self._volume_flush_id = self.after(33, self._apply_volume, volume_value)
+
+    def _apply_volume(self, volume_value: float) -> None:
+        """Changes the audio level and remembers when it happened."""
+        self._volume_flush_id = None
+        self._last_volume_time = time.perf_counter()
+        volume_func(volume_value)
+
 
 class ButtonsFrame(ctk.CTkFrame):
     """A frame that contains all our player buttons and their related functions."""
@@ -240,20 +464,22 @@ class ButtonsFrame(ctk.CTkFrame):
 
         self.id = None
         self.song_path = None
+        self.song_duration = 0
+        self._time_table = []  # The 'MM:SS' text of every second of the current song.
         self.song_name = None
         self.song_index = None
         self.play_list_widget = main_app.get_playlist_widget()  # A reference to our playlist widget.
         self.song_dictionary = main_app.get_song_dictionary()  # A reference to our song dictionary.
         self.main_app = main_app
         self.playing = False  # Music player status
-        self.seek_position = 0
+        self.seek_position = 0  # Where the current playback started from, in whole seconds.
         # Binding double click to the playlist widget
         self.play_list_widget.bind('<Double-Button-1>', lambda e: self.play())
+        icons = _icons_future.result()  # usually ready by now, otherwise waits for the loader thread
 
         # Back Button
-        self.back_button_image = ctk.CTkImage(light_image=PIL.Image.open('assets\\left-arrows.png'), size=(50, 50))
         self.back_button = ctk.CTkButton(self,
-                                         image=self.back_button_image,
+                                         image=ctk.CTkImage(light_image=icons['back'], size=(50, 50)),
                                          text='',
                                          width=50,
                                          height=50,
@@ -261,9 +487,8 @@ class ButtonsFrame(ctk.CTkFrame):
                                          hover=True,
                                          command=self.back)
         # Forward Button
-        self.forward_button_image = ctk.CTkImage(light_image=PIL.Image.open('assets\\next.png'), size=(50, 50))
         self.forward_button = ctk.CTkButton(self,
-                                            image=self.forward_button_image,
+                                            image=ctk.CTkImage(light_image=icons['forward'], size=(50, 50)),
                                             text='',
                                             width=50,
                                             height=50,
@@ -271,9 +496,8 @@ class ButtonsFrame(ctk.CTkFrame):
                                             hover=True,
                                             command=self.next_)
         # Play button
-        self.play_button_image = ctk.CTkImage(light_image=PIL.Image.open('assets\\play-button.png'), size=(50, 50))
         self.play_button = ctk.CTkButton(self,
-                                         image=self.play_button_image,
+                                         image=ctk.CTkImage(light_image=icons['play'], size=(50, 50)),
                                          text='',
                                          width=50,
                                          height=50,
@@ -282,9 +506,8 @@ class ButtonsFrame(ctk.CTkFrame):
                                          hover=True,
                                          command=self.play)
         # Pause button
-        self.pause_button_image = ctk.CTkImage(light_image=PIL.Image.open('assets\\pause.png'), size=(50, 50))
         self.pause_button = ctk.CTkButton(self,
-                                          image=self.pause_button_image,
+                                          image=ctk.CTkImage(light_image=icons['pause'], size=(50, 50)),
                                           text='',
                                           width=50,
                                           height=50,
@@ -292,9 +515,8 @@ class ButtonsFrame(ctk.CTkFrame):
                                           hover=True,
                                           command=self.pause)
         # Stop button
-        self.stop_button_image = ctk.CTkImage(light_image=PIL.Image.open('assets\\stop-button.png'), size=(50, 50))
         self.stop_button = ctk.CTkButton(self,
-                                         image=self.stop_button_image,
+                                         image=ctk.CTkImage(light_image=icons['stop'], size=(50, 50)),
                                          text='',
                                          width=50,
                                          height=50,
@@ -309,22 +531,27 @@ class ButtonsFrame(ctk.CTkFrame):
         self.pause_button.grid(row=0, column=3)
         self.stop_button.grid(row=0, column=4)
 
+        self.monitor_song_end()  # start watching for the end of songs
+
     def play(self):
-        """Starts playing music."""
+        """Starts playing the song selected in the playlist."""
+        self._load_and_play(self.play_list_widget.curselection()[0])  # the index of selected song
+
+    def _load_and_play(self, song_index: int) -> None:
+        """Starts playing the song at the given index of the playlist."""
         self.seek_position = 0  # Reset seek position when a new song starts
-        self.song_index = self.play_list_widget.curselection()[0]  # gets the index of selected song
+        self.song_index = song_index
         self.song_name = self.play_list_widget.get(self.song_index)  # gets the title of selected song
-        self.song_path = self.main_app.get_song_dictionary()[
-            self.song_name]  # gets the path to the song on file system from dictionary
+        # gets the path to the song on file system and its cached length from dictionary
+        self.song_path, self.song_duration = self.main_app.get_song_dictionary()[self.song_name]
 
         # load and start playing the song
         pygame.mixer.music.load(self.song_path)
         pygame.mixer.music.play()
 
         self.playing = True  # change the status to True
-        self._get_song_duration()
-
-        self.monitor_song_end()
+        # letting Tk redraw the window first, then filling in the song's info
+        self.main_app.after_idle(self._get_song_duration)
 
     def stop(self):
         """Stops the playback and resets the position."""
@@ -350,61 +577,67 @@ class ButtonsFrame(ctk.CTkFrame):
     def next_(self):
         """Plays the next song in the playlist."""
         # Deciding if it should go to next song or start from beginning if it reached the end
-        new_song_index = self.song_index + 1 if self.song_index < len(self.song_dictionary) - 1 else 0
+        new_song_index = self.song_index + 1 if self.song_index < self.play_list_widget.size() - 1 else 0
 
         self.play_list_widget.selection_set(new_song_index)  # selects the next song
         self.play_list_widget.activate(new_song_index)  # activates the song
         self.play_list_widget.selection_clear(self.song_index)  # unselect the last song
-        self.play()  # starts playing
+        self._load_and_play(new_song_index)  # starts playing, we already know the index
 
     def back(self):
         """Plays the song before in the playlist."""
         # Deciding if it should go to song before or goes to the end of playlist
-        new_song_index = self.song_index - 1 if self.song_index else 'end'
+        new_song_index = self.song_index - 1 if self.song_index else self.play_list_widget.size() - 1
 
         self.play_list_widget.selection_set(new_song_index)
         self.play_list_widget.activate(new_song_index)
         self.play_list_widget.selection_clear(self.song_index)
-        self.play()
+        self._load_and_play(new_song_index)
 
     def _get_song_duration(self):
         """Gets the length of the current song"""
-        current_song_total_seconds = int(MP3(self.song_path).info.length)
+        current_song_total_seconds = self.song_duration  # cached when the song was imported
         # formatting the song duration to a human-readable format
         self.current_song_duration_formatted = _format_seconds(current_song_total_seconds)
+        # formatting every second of the song up front, so refreshing the status bar is only a lookup
+        self._time_table = [_format_seconds(second) for second in range(current_song_total_seconds + 2)]
         # setting the upper edge of our song slider the current song's length
         self.main_app.progress_slide.configure(to=current_song_total_seconds)
 
-        # update the text in status bar
+        # update the text in status bar, replacing the loop of the previous song if there is one
+        if self.id:
+            self.after_cancel(self.id)
         self.update_label()
 
     def update_label(self):
         """Updates the info on status bar"""
         if self.playing:  # if any song is playing
             # calculate the current position in the song by considering our seek position
-            current_song_position = int(pygame.mixer.music.get_pos() / 1000) + int(self.seek_position)
+            # get_pos() is -1 once the music has stopped, so it's clamped before adding the seek position
+            current_song_position = max(pygame.mixer.music.get_pos(), 0) // 1000 + self.seek_position
             # formatting the current song position to a human-readable format
-            pos_text = _format_seconds(current_song_position)
+            pos_text = self._time_table[min(current_song_position, len(self._time_table) - 1)]
             # updating the text
             self.main_app.status_bar.config(
                 text=f'Time Elapsed: {pos_text} of {self.current_song_duration_formatted}  ')
             # updating the progress bar position
             self.main_app.progress_slide.set(current_song_position)
             # running the `update_label` again and storing its ID for later use
-            self.id = self.after(300, self.update_label)
+            self.id = self.after(500, self.update_label)
 
     def monitor_song_end(self):
         """
-        Periodically checks if the song has finished playing. If the song is no longer playing,
-        and it was supposed to be playing (i.e., hasn't been paused or stopped manually),
-        it calls the stop method to reset the player. This method schedules itself to run
-        every 400 milliseconds to continuously monitor the song playback status.
+        Drains the song end events that pygame posts when the music stops. If one arrived while
+        a song was supposed to be playing (i.e., hasn't been paused or stopped manually) and
+        nothing has been started since, it moves on to the next song. This method schedules
+        itself to run every 500 milliseconds for the lifetime of the app.
         """
-
-        if not pygame.mixer.music.get_busy() and self.playing:
+        # draining the whole queue, so events we don't care about can't pile up in it
+        song_ended = any(event.type == SONG_END_EVENT for event in pygame.event.get())
+        # a new song may have been started since the event was posted, so make sure nothing is playing
+        if song_ended and self.playing and not pygame.mixer.music.get_busy():
             self.next_()
-        else:
-            self.after(400, self.monitor_song_end)
+        self.after(500, self.monitor_song_end)
 
 
 app = App()